@@ -34,7 +34,7 @@ class AsyncEventDispatcher(EventDispatcher):
         self._temporary_listeners = collections.defaultdict(list)
 
     def __call__(self, event: str, *args):
-        log.debug(f"dispatching event (on_){event}")
+        log.debug("dispatching event (on_)%s", event)
         event = "on_" + event
 
         for func in self._event_listeners[event]:
@@ -1,6 +1,7 @@
 import asyncio
 import itertools
 import logging
+import socket
 import time
 import weakref
 from abc import ABC, abstractmethod
@@ -11,7 +12,6 @@ from ..errors import LoginFailure, RCONCommandError
 from ..protocol import (
     ClientAuthEvent,
     ClientEvent,
-    ClientCommandPacket,
     ClientPacket,
     ClientCommandEvent,
     RCONClientProtocol,
@@ -25,10 +25,9 @@ if TYPE_CHECKING:
     from .client import AsyncRCONClient
 
 
-def maybe_replace_future(fut: asyncio.Future | None) -> asyncio.Future:
-    if fut is None or fut.done():
-        return asyncio.get_running_loop().create_future()
-    return fut
+def _check_keep_alive(task: asyncio.Task) -> None:
+    if not isinstance(task.exception(), RCONCommandError):
+        task.result()  # unexpected error
 
 
 class AsyncClientProtocol(ABC):
@@ -39,7 +38,12 @@ class AsyncClientProtocol(ABC):
 
     LAST_RECEIVED_TIMEOUT = 45  # don't change, specified by protocol
 
-    _client: "AsyncRCONClient | None" = None
+    __slots__ = ("_client", "__weakref__")
+
+    _client: "AsyncRCONClient | None"
+
+    def __init__(self) -> None:
+        self._client = None
 
     @property
     def client(self) -> "AsyncRCONClient | None":
@@ -124,7 +128,11 @@ class AsyncCommander:
     io_layer: AsyncClientProtocol | None
     proto_layer: RCONClientProtocol | None
 
-    _command_futures: dict[int, asyncio.Future[str]]
+    _command_futures: list["asyncio.Future[str] | None"]
+    """A list of futures indexed by each command's sequence number (0-255)."""
+
+    _loop: asyncio.AbstractEventLoop | None
+    """The running event loop, bound on first use."""
 
     def __init__(
         self,
@@ -138,7 +146,14 @@ class AsyncCommander:
         self.command_attempts = command_attempts
         self.command_interval = command_interval
 
-        self._command_futures = {}
+        self._command_futures = [None] * 256
+        self._loop = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
 
     def cancel_command(self, sequence: int) -> None:
         """Cancels a command in the protocol along with its associated future.
@@ -156,14 +171,16 @@ class AsyncCommander:
             return
 
         self.proto_layer.invalidate_command(sequence)
-        fut = self._command_futures.pop(sequence, None)
+        fut = self._command_futures[sequence]
         if fut is not None:
+            self._command_futures[sequence] = None
             fut.cancel()
 
     def reset(self) -> None:
-        for fut in self._command_futures.values():
-            fut.cancel()
-        self._command_futures.clear()
+        for sequence, fut in enumerate(self._command_futures):
+            if fut is not None:
+                self._command_futures[sequence] = None
+                fut.cancel()
 
     def set_command(self, sequence: int, message: str) -> None:
         """Notifies the future waiting on a command response packet.
@@ -174,8 +191,9 @@ class AsyncCommander:
         If no future was created for the packet, this is a no-op.
 
         """
-        fut = self._command_futures.pop(sequence, None)
+        fut = self._command_futures[sequence]
         if fut is not None:
+            self._command_futures[sequence] = None
             fut.set_result(message)
 
     async def send_command(self, command: str) -> str:
@@ -185,35 +203,50 @@ class AsyncCommander:
             raise RuntimeError("proto_layer must be assigned")
 
         packet = self.proto_layer.send_command(command)
+        loop = self._get_loop()
 
         for _ in range(self.command_attempts):
             self.io_layer.send(packet)
 
+            fut = self.wait_for_command(packet.sequence)
+            timer = loop.call_later(
+                self.command_interval, self._expire_command, packet.sequence
+            )
+
             try:
-                # NOTE: if we let wait_for() cancel the future, it is possible
-                # for _set_command() to be called just before our finally
-                # statement is reached, allowing _set_command() to throw
-                # an InvalidStateError.
-                return await asyncio.wait_for(
-                    asyncio.shield(self.wait_for_command(packet.sequence)),
-                    timeout=self.command_interval,
-                )
+                return await fut
             except asyncio.TimeoutError:
                 pass
             finally:
+                timer.cancel()
                 self.cancel_command(packet.sequence)
 
-        log.warning(f"could not send command after {self.command_attempts} attempts")
+        log.warning("could not send command after %d attempts", self.command_attempts)
         raise RCONCommandError(f"failed to send command: {command!r}")
 
+    def _expire_command(self, sequence: int) -> None:
+        """Times out the future waiting on a command response.
+
+        Unlike :py:func:`asyncio.wait_for()`, this leaves the future's
+        consumer to decide whether to retry, without needing a shield
+        task per attempt.
+
+        """
+        fut = self._command_futures[sequence]
+        if fut is not None and not fut.done():
+            # Clear the slot first so a response arriving between this
+            # callback and the consumer's cleanup cannot resolve the
+            # already-failed future
+            self._command_futures[sequence] = None
+            fut.set_exception(asyncio.TimeoutError())
+
     def wait_for_command(self, sequence: int) -> asyncio.Future[str]:
         """Returns a future waiting for a command response with
         the given sequence number.
         """
-        fut = self._command_futures.get(sequence)
+        fut = self._command_futures[sequence]
         if fut is None:
-            loop = asyncio.get_running_loop()
-            self._command_futures[sequence] = fut = loop.create_future()
+            self._command_futures[sequence] = fut = self._get_loop().create_future()
 
         return fut
 
@@ -224,8 +257,11 @@ class ConnectorConfig:
 
     run_interval: float = 1.0
     """
-    The amount of time in seconds to wait between each run loop iteration
-    (which handles re-connecting and sending keep alive packets).
+    The minimum amount of time in seconds to wait between each run loop
+    iteration (which handles re-connecting and sending keep alive packets).
+
+    The loop otherwise sleeps until the next keep alive or timeout
+    deadline instead of waking at this interval.
     """
     keep_alive_interval: float = 30.0
     """
@@ -257,10 +293,44 @@ class ConnectorConfig:
     The amount of time in seconds to wait after a login attempt before retrying.
     """
 
+    receive_buffer_size: int | None = None
+    """
+    An optional size in bytes for the socket's receive buffer (SO_RCVBUF).
+
+    Raising this can reduce datagram loss when the server sends
+    bursts of messages. If ``None``, the operating system's default
+    is left untouched.
+    """
+    send_buffer_size: int | None = None
+    """
+    An optional size in bytes for the socket's send buffer (SO_SNDBUF).
+
+    If ``None``, the operating system's default is left untouched.
+    """
+
 
 class AsyncClientConnector(AsyncClientProtocol):
     """An asyncio implementation of the :py:class:`AsyncClientProtocol`."""
 
+    _BACKOFF_SCHEDULE = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+    """Exponential backoff delays in seconds used between login attempts."""
+
+    __slots__ = (
+        "commander",
+        "config",
+        "protocol",
+        "_addr",
+        "_close_event",
+        "_event_handlers",
+        "_is_logged_in",
+        "_last_command",
+        "_last_players",
+        "_last_received",
+        "_last_sent",
+        "_task",
+        "_transport",
+    )
+
     _addr: tuple[str, int] | None
     _last_command: float
     _last_received: float
@@ -293,11 +363,21 @@ class AsyncClientConnector(AsyncClientProtocol):
 
         self._close_event = asyncio.Event()
         self._transport: asyncio.DatagramTransport | None = None
+        self._event_handlers = {
+            ClientAuthEvent: self._handle_auth_event,
+            ClientCommandEvent: self._handle_command_event,
+            ClientMessageEvent: self._handle_message_event,
+        }
         self._reset()
 
     def close(self) -> None:
         self._close_event.set()
 
+        # Wake anyone in wait_for_login() that would otherwise
+        # never receive a response
+        if self._is_logged_in is not None and not self._is_logged_in.done():
+            self._is_logged_in.set_result(False)
+
     def is_connected(self) -> bool:
         return self._transport is not None
 
@@ -321,11 +401,13 @@ class AsyncClientConnector(AsyncClientProtocol):
 
     def send(self, packet: ClientPacket):
         assert self._transport is not None
-        self._transport.sendto(packet.data, self._addr)
-        log.debug(f"sent {packet.type.name} packet")
+        # The transport's socket is connected to the server
+        # so the address can be omitted
+        self._transport.sendto(packet.data)
+        log.debug("sent %s packet", packet.type.name)
 
         self._last_sent = time.monotonic()
-        if isinstance(packet, ClientCommandPacket):
+        if packet.is_command:
             self._last_command = self._last_sent
 
     async def send_command(self, command: str) -> str:
@@ -333,27 +415,16 @@ class AsyncClientConnector(AsyncClientProtocol):
 
     async def wait_for_login(self) -> bool:
         # This method may be called before run() so we need to
-        # make sure the futures are initialized with something
-        loop = asyncio.get_running_loop()
+        # make sure the future is initialized with something
         if self._is_logged_in is None:
-            self._is_logged_in = loop.create_future()
-
-        close_task = asyncio.create_task(
-            self._close_event.wait(),
-            name="berconpy-wait-for-login",
-        )
-        done, _ = await asyncio.wait(
-            (self._is_logged_in, close_task),
-            return_when=asyncio.FIRST_COMPLETED,
-        )
+            if self._close_event.is_set():
+                # Closed without having connected
+                return False
+            self._is_logged_in = asyncio.get_running_loop().create_future()
 
-        fut = done.pop()
-        if fut is self._is_logged_in:
-            close_task.cancel()
-            return self._is_logged_in.result()
-        else:
-            # Closed without having connected
-            return False
+        # close() resolves the future if it is still pending,
+        # so awaiting it directly covers both outcomes
+        return await self._is_logged_in
 
     def _reset(self):
         self._reset_protocol()
@@ -399,12 +470,32 @@ class AsyncClientConnector(AsyncClientProtocol):
             lambda: self,  # type: ignore
             remote_addr=self._addr,
         )
+        self._configure_socket(self._transport)
 
         packet = self.protocol.authenticate(password)
         self.send(packet)
 
         return await self.wait_for_login()
 
+    def _configure_socket(self, transport: asyncio.DatagramTransport) -> None:
+        """Applies the configured buffer sizes to the transport's socket."""
+        sock = transport.get_extra_info("socket")
+        if sock is None:
+            return
+
+        if self.config.receive_buffer_size is not None:
+            sock.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_RCVBUF,
+                self.config.receive_buffer_size,
+            )
+        if self.config.send_buffer_size is not None:
+            sock.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_SNDBUF,
+                self.config.send_buffer_size,
+            )
+
     def disconnect(self) -> None:
         """Disconnects the protocol from the server."""
         if self._transport is not None:
@@ -444,25 +535,36 @@ class AsyncClientConnector(AsyncClientProtocol):
                 else:
                     log.info("successfully connected to the server")
 
-            elapsed_time = time.monotonic() - self._last_received
+            now = time.monotonic()
+
+            elapsed_time = now - self._last_received
             if elapsed_time > self.LAST_RECEIVED_TIMEOUT:
                 log.info(
-                    f"server has timed out (last received {elapsed_time:.0f} seconds ago)"
+                    "server has timed out (last received %.0f seconds ago)",
+                    elapsed_time,
                 )
                 self._reset_protocol()
                 self._is_logged_in = loop.create_future()
                 continue
 
-            elapsed_time = time.monotonic() - self._last_command
+            elapsed_time = now - self._last_command
             if elapsed_time > self.config.keep_alive_interval:
                 log.debug("sending keep alive packet")
                 # NOTE: may result in "Task destroyed but it is pending!"
                 #       TaskGroup would be a good idea here
                 keep_alive_task = self._begin_keep_alive()
 
+            # Sleep until whichever deadline comes first rather than
+            # polling at a fixed interval
+            next_deadline = min(
+                self._last_received + self.LAST_RECEIVED_TIMEOUT,
+                self._last_command + self.config.keep_alive_interval,
+            )
+            timeout = max(next_deadline - now, self.config.run_interval)
+
             try:
                 coro = self._close_event.wait()
-                await asyncio.wait_for(coro, timeout=self.config.run_interval)
+                await asyncio.wait_for(coro, timeout=timeout)
             except asyncio.TimeoutError:
                 pass
 
@@ -490,11 +592,11 @@ class AsyncClientConnector(AsyncClientProtocol):
 
         """
         log.info(
-            "attempting to {re}connect to server".format(
-                re="re" * (not first_iteration)
-            )
+            "attempting to %sconnect to server",
+            "re" * (not first_iteration),
         )
-        self._is_logged_in = maybe_replace_future(self._is_logged_in)
+        if self._is_logged_in is None or self._is_logged_in.done():
+            self._is_logged_in = asyncio.get_running_loop().create_future()
 
         attempts = itertools.count()
         if first_iteration:
@@ -514,29 +616,27 @@ class AsyncClientConnector(AsyncClientProtocol):
 
                 # exponential backoff
                 self.disconnect()
-                await asyncio.sleep(2 ** (i % 11))
+                schedule = self._BACKOFF_SCHEDULE
+                await asyncio.sleep(schedule[i % len(schedule)])
 
         return False
 
     def _begin_keep_alive(self) -> asyncio.Task[None]:
-        def done_callback(task: asyncio.Task):
-            if not isinstance(task.exception(), RCONCommandError):
-                task.result()  # unexpected error
-
         task = asyncio.create_task(
             self._send_keep_alive(),
             name="berconpy-keep-alive",
         )
-        task.add_done_callback(done_callback)
+        task.add_done_callback(_check_keep_alive)
         return task
 
     async def _send_keep_alive(self) -> None:
         assert self.client is not None
 
-        if time.monotonic() - self._last_players > self.config.players_interval:
+        now = time.monotonic()
+        if now - self._last_players > self.config.players_interval:
             # Instead of an empty message, ask for players so we can
             # periodically update the client's cache
-            self._last_players = time.monotonic()
+            self._last_players = now
             response = await self.send_command("players")
             self.client.cache.update_players(response)
         else:
@@ -545,30 +645,34 @@ class AsyncClientConnector(AsyncClientProtocol):
     # RCONClientProtocol handling
 
     def _handle_event(self, event: ClientEvent) -> None:
-        assert self.client is not None
-
-        if isinstance(event, ClientAuthEvent):
-            assert self._is_logged_in is not None
-            if self._is_logged_in.done():
-                return
-
-            if event.success:
-                self._is_logged_in.set_result(True)
-                self.client.dispatch("login")
-            else:
-                self._is_logged_in.set_exception(
-                    LoginFailure("invalid password provided")
-                )
+        handler = self._event_handlers.get(type(event))
+        if handler is None:
+            raise RuntimeError(f"unhandled event type {type(event)}")
 
-        elif isinstance(event, ClientCommandEvent):
-            self.commander.set_command(event.sequence, event.message)
-            self.client.dispatch("command", event.message)
+        handler(event)
 
-        elif isinstance(event, ClientMessageEvent):
-            self.client.dispatch("message", event.message)
+    def _handle_auth_event(self, event: ClientAuthEvent) -> None:
+        assert self.client is not None
+        assert self._is_logged_in is not None
+        if self._is_logged_in.done():
+            return
 
+        if event.success:
+            self._is_logged_in.set_result(True)
+            self.client.dispatch("login")
         else:
-            raise RuntimeError(f"unhandled event type {type(event)}")
+            self._is_logged_in.set_exception(
+                LoginFailure("invalid password provided")
+            )
+
+    def _handle_command_event(self, event: ClientCommandEvent) -> None:
+        assert self.client is not None
+        self.commander.set_command(event.sequence, event.message)
+        self.client.dispatch("command", event.message)
+
+    def _handle_message_event(self, event: ClientMessageEvent) -> None:
+        assert self.client is not None
+        self.client.dispatch("message", event.message)
 
     # DatagramProtocol
 
@@ -597,24 +701,29 @@ class AsyncClientConnector(AsyncClientProtocol):
         .. seealso:: :py:meth:`asyncio.DatagramProtocol.datagram_received()`
 
         """
-        assert self.client is not None
+        client = self.client
+        protocol = self.protocol
+        assert client is not None
 
-        if addr != self._addr:
-            return log.debug(f"ignoring message from unknown address: {addr}")
+        # No need to filter addr here; the socket is connected to the
+        # server's address so the kernel discards foreign datagrams
 
         try:
-            packet = self.protocol.receive_datagram(data)
+            packet = protocol.receive_datagram(data)
         except ValueError as e:
-            return log.debug(f"ignoring malformed data with cause:", exc_info=e)
+            return log.debug("ignoring malformed data with cause:", exc_info=e)
 
-        log.debug(f"{packet.type.name} received")
+        log.debug("%s received", packet.type.name)
         self._last_received = time.monotonic()
-        self.client.dispatch("raw_event", packet)
+        client.dispatch("raw_event", packet)
+
+        handle_event = self._handle_event
+        for event in protocol.events_received():
+            handle_event(event)
 
-        for event in self.protocol.events_received():
-            self._handle_event(event)
-        for packet in self.protocol.packets_to_send():
-            self.send(packet)
+        send = self.send
+        for packet in protocol.packets_to_send():
+            send(packet)
 
     def error_received(self, exc: OSError):
         """Handles an exceptional error from the protocol.
@@ -116,6 +116,5 @@ class RCONClientCache(ABC):
             current_ids.add(player["id"])
 
         # Throw away players no longer in the server
-        previous_ids = set(p.id for p in self.players)
-        for missing in previous_ids - current_ids:
+        for missing in [p.id for p in self.players if p.id not in current_ids]:
             self.remove_player(missing)
@@ -1,4 +1,3 @@
-from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Awaitable
 import weakref
 
@@ -7,8 +6,16 @@ if TYPE_CHECKING:
     from .client import RCONClient
 
 
-class Player(ABC):
-    """Represents a player in the server."""
+class Player:
+    """Represents a player in the server.
+
+    The RCON operations below are left unimplemented here and must be
+    overridden by subclasses. A plain class is used instead of an ABC
+    so instantiation skips the abstract-method check that ABCMeta adds,
+    which matters when hundreds of players are rebuilt on every
+    "players" refresh.
+
+    """
 
     __slots__ = (
         "_cache",
@@ -119,7 +126,6 @@ class Player(ABC):
         """Returns the client associated with the cache."""
         return self.cache.client
 
-    @abstractmethod
     def ban_guid(
         self,
         duration: int | None = None,
@@ -136,8 +142,8 @@ class Player(ABC):
 
         """
         # NOTE: ban #ID does the same as adding the player's GUID
+        raise NotImplementedError
 
-    @abstractmethod
     def ban_ip(
         self,
         duration: int | None = None,
@@ -153,12 +159,12 @@ class Player(ABC):
         :returns: The response from the server, if any.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def is_connected(self) -> bool:
         """Checks if this player is still in the client's cache."""
+        raise NotImplementedError
 
-    @abstractmethod
     def kick(self, reason: str = "") -> str | Awaitable[str]:
         """Kicks this player from the server.
 
@@ -166,8 +172,8 @@ class Player(ABC):
         :returns: The response from the server, if any.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def send(self, message: str) -> str | Awaitable[str]:
         """Sends a message to this player.
 
@@ -175,3 +181,4 @@ class Player(ABC):
         :returns: The response from the server, if any.
 
         """
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
 from .packet import Packet
 
@@ -9,6 +9,8 @@ __all__ = ("RCONGenericProtocol",)
 class RCONGenericProtocol(ABC):
     """The base class for handling the RCON protocol between two computers."""
 
+    __slots__ = ()
+
     @abstractmethod
     def receive_datagram(self, data: bytes) -> Packet:
         """Provides a packet from the remote computer to potentially
@@ -18,6 +20,19 @@ class RCONGenericProtocol(ABC):
 
         """
 
+    def receive_datagrams(self, datagrams: Iterable[bytes]) -> list[Packet]:
+        """Provides several packets from the remote computer at once.
+
+        This is a convenience over calling :py:meth:`receive_datagram()`
+        for each datagram, e.g. when the transport reads them in batches.
+
+        If any of the given datagrams are invalid, this method raises an
+        error and the remaining datagrams are left unprocessed.
+
+        """
+        receive = self.receive_datagram
+        return [receive(data) for data in datagrams]
+
     @abstractmethod
     def events_received(self) -> Sequence[Any]:
         """Retrieves all events that have been parsed since this was last called."""
@@ -1,4 +1,3 @@
-import collections
 from typing import Generic, Protocol, TypeVar
 
 __all__ = (
@@ -42,25 +41,58 @@ class NonceCheck:
 
     """
 
-    deque: collections.deque[int]
+    __slots__ = ("_head", "_max_size", "_ring", "_seen", "_size")
+
+    _seen: int
+    """A 256-bit bitmap with one bit set per sequence in the window."""
+    _ring: bytearray
+    """A ring buffer of the window's sequences in insertion order."""
+    _head: int
+    """The ring index that the next accepted sequence will overwrite."""
+    _size: int
+    """The number of sequences currently in the window."""
 
     def __init__(self, max_size: int):
         if max_size not in range(256):
             raise ValueError(f"max_size must be within 0-255, not {max_size!r}")
-        self.deque = collections.deque((), max_size)
+        self._max_size = max_size
+        self._ring = bytearray(max_size)
+        self.reset()
 
     def __call__(self, packet: Sequential) -> bool:
-        if packet.sequence in self.deque:
+        sequence = packet.sequence
+        bit = 1 << sequence
+        if self._seen & bit:
             return False
 
-        self.deque.append(packet.sequence)
+        max_size = self._max_size
+        if max_size == 0:
+            # Tracking is disabled entirely
+            return True
+
+        head = self._head
+        if self._size == max_size:
+            # Evict the oldest sequence to make room
+            self._seen &= ~(1 << self._ring[head])
+        else:
+            self._size += 1
+
+        self._ring[head] = sequence
+        self._seen |= bit
+
+        head += 1
+        if head == max_size:
+            head = 0
+        self._head = head
+
         return True
 
     def reset(self) -> None:
-        self.deque.clear()
+        self._seen = 0
+        self._head = 0
+        self._size = 0
 
     @property
     def max_size(self) -> int:
         """The maximum number of sequences that the check can keep track of."""
-        assert self.deque.maxlen is not None
-        return self.deque.maxlen
+        return self._max_size
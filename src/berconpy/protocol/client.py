@@ -1,5 +1,4 @@
 import enum
-from typing import Iterable
 
 from .base import RCONGenericProtocol
 from .check import Check, NonceCheck
@@ -12,6 +11,14 @@ from .events import (
 )
 from .packet import *
 
+_MESSAGE_ACKS = tuple(ClientMessagePacket(i) for i in range(256))
+"""Pre-built acknowledgement packets indexed by message sequence.
+
+Ack contents are fully determined by the 1-byte sequence, so these
+are constructed once instead of per message received.
+
+"""
+
 
 class ClientState(enum.Enum):
     """Defines the current state of the protocol."""
@@ -22,6 +29,34 @@ class ClientState(enum.Enum):
     """The client is logged in and able to send/receive messages."""
 
 
+class _IncomingCommand:
+    """Accumulates the response packets for a command sent to the server."""
+
+    __slots__ = ("full_mask", "parts", "received_mask")
+
+    parts: "list[bytes | None] | None"
+    """The message of each response packet, indexed by packet index.
+
+    This is lazily allocated by the first response packet,
+    whose total defines the expected length.
+
+    """
+    received_mask: int
+    """A bitmap with one bit set per packet index received so far."""
+    full_mask: int
+    """The value of :py:attr:`received_mask` once every packet has arrived.
+
+    Computed alongside :py:attr:`parts` so each fragment only needs
+    an equality comparison to test for completion.
+
+    """
+
+    def __init__(self) -> None:
+        self.parts = None
+        self.received_mask = 0
+        self.full_mask = 0
+
+
 class RCONClientProtocol(RCONGenericProtocol):
     """Implements the client-side portion of the protocol.
 
@@ -37,13 +72,13 @@ class RCONClientProtocol(RCONGenericProtocol):
 
     _events: list[ClientEvent]
     """A list of events waiting to be collected."""
-    _command_queue: dict[int, dict[int, ServerCommandPacket]]
-    """A mapping of command sequences to mappings of command indexes to their packets.
+    _command_queue: "list[_IncomingCommand | None]"
+    """A list of response accumulators indexed by command sequence (0-255).
 
-    When :py:meth:`send_command()` is used, an entry is added here to
-    store the appropriate responses. Once all expected responses are
-    received, they are joined into a single message and converted into
-    a :py:class:`CommandResponseEvent`.
+    When :py:meth:`send_command()` is used, the sequence's slot is
+    filled to store the appropriate responses. Once all expected
+    responses are received, they are joined into a single message and
+    converted into a :py:class:`CommandResponseEvent`.
 
     """
     _next_sequence: int
@@ -58,6 +93,11 @@ class RCONClientProtocol(RCONGenericProtocol):
             message_check = NonceCheck(5)
 
         self.message_check = message_check
+        self._packet_handlers = {
+            ServerLoginPacket: self._handle_login_packet,
+            ServerCommandPacket: self._handle_command_packet,
+            ServerMessagePacket: self._handle_message_packet,
+        }
         self.reset()
 
     def __repr__(self) -> str:
@@ -80,8 +120,18 @@ class RCONClientProtocol(RCONGenericProtocol):
         """
         packet = Packet.from_bytes(data, from_client=False)
         events, to_send = self._handle_packet(packet)
-        self._events.extend(events)
-        self._to_send.extend(to_send)
+
+        # Handlers return at most one of each, so take the fast path
+        # around the iterator protocol when possible
+        if len(events) == 1:
+            self._events.append(events[0])
+        else:
+            self._events.extend(events)
+
+        if len(to_send) == 1:
+            self._to_send.append(to_send[0])
+        else:
+            self._to_send.extend(to_send)
 
         return packet
 
@@ -119,7 +169,7 @@ class RCONClientProtocol(RCONGenericProtocol):
 
         """
         self._assert_state(ClientState.LOGGED_IN)
-        self._command_queue.pop(sequence, None)
+        self._command_queue[sequence] = None
 
     def reset(self) -> None:
         """Resets the protocol to the beginning state.
@@ -131,7 +181,7 @@ class RCONClientProtocol(RCONGenericProtocol):
 
         """
         self._events = []
-        self._command_queue = {}
+        self._command_queue = [None] * 256
         self._next_sequence = 0
         self.state = ClientState.AUTHENTICATING
         self._to_send = []
@@ -151,56 +201,66 @@ class RCONClientProtocol(RCONGenericProtocol):
         """
         self._assert_state(ClientState.LOGGED_IN)
         sequence = self._get_next_sequence()
-        self._command_queue[sequence] = {}
+        self._command_queue[sequence] = _IncomingCommand()
         return ClientCommandPacket(sequence, command.encode())
 
-    def _assert_state(self, *states: ClientState) -> None:
-        if self.state not in states:
-            raise InvalidStateError(self.state, states)
+    def _assert_state(self, state: ClientState) -> None:
+        if self.state is not state:
+            raise InvalidStateError(self.state, (state,))
 
     def _get_next_sequence(self) -> int:
         sequence = self._next_sequence
-        self._next_sequence = (sequence + 1) % 256
+        self._next_sequence = (sequence + 1) & 0xFF
         return sequence
 
     def _handle_packet(
         self,
         packet: ServerPacket,
-    ) -> tuple[Iterable[ClientEvent], Iterable[ClientPacket]]:
+    ) -> tuple[tuple[ClientEvent, ...], tuple[ClientPacket, ...]]:
         """Handles the given :py:class:`ServerPacket`.
 
         :returns: A tuple containing the events and payloads to send.
         :raises ValueError: An error occurred while handling the given packet.
 
         """
-        if isinstance(packet, ServerLoginPacket):
-            self._assert_state(ClientState.AUTHENTICATING)
+        handler = self._packet_handlers.get(type(packet))
+        if handler is None:  # pragma: no cover
+            raise ValueError(f"unexpected packet received: {packet}")
 
-            if packet.login_success:
-                self.state = ClientState.LOGGED_IN
+        return handler(packet)
 
-            return (ClientAuthEvent(packet.login_success),), ()
+    def _handle_login_packet(
+        self,
+        packet: ServerLoginPacket,
+    ) -> tuple[tuple[ClientEvent, ...], tuple[ClientPacket, ...]]:
+        """Specifically handles a :py:class:`ServerLoginPacket`."""
+        self._assert_state(ClientState.AUTHENTICATING)
 
-        elif isinstance(packet, ServerCommandPacket):
-            return self._handle_command_packet(packet)
+        if packet.login_success:
+            self.state = ClientState.LOGGED_IN
 
-        elif isinstance(packet, ServerMessagePacket):
-            # Acknowledge the message
-            self._assert_state(ClientState.LOGGED_IN)
+        return (ClientAuthEvent(packet.login_success),), ()
 
-            if self.message_check(packet):
-                events = (ClientMessageEvent(packet.message.decode()),)
-            else:
-                events = ()
+    def _handle_message_packet(
+        self,
+        packet: ServerMessagePacket,
+    ) -> tuple[tuple[ClientEvent, ...], tuple[ClientPacket, ...]]:
+        """Specifically handles a :py:class:`ServerMessagePacket`
+        by acknowledging it.
+        """
+        self._assert_state(ClientState.LOGGED_IN)
 
-            return events, (ClientMessagePacket(packet.sequence),)
+        if self.message_check(packet):
+            events = (ClientMessageEvent(packet.message.decode()),)
+        else:
+            events = ()
 
-        raise ValueError(f"unexpected packet received: {packet}")  # pragma: no cover
+        return events, (_MESSAGE_ACKS[packet.sequence],)
 
     def _handle_command_packet(
         self,
         packet: ServerCommandPacket,
-    ) -> tuple[Iterable[ClientEvent], Iterable[ClientPacket]]:
+    ) -> tuple[tuple[ClientEvent, ...], tuple[ClientPacket, ...]]:
         """Specifically handles a :py:class:`ServerCommandPacket`.
 
         :returns: A tuple containing the events and payloads to send.
@@ -209,34 +269,47 @@ class RCONClientProtocol(RCONGenericProtocol):
         """
         self._assert_state(ClientState.LOGGED_IN)
 
-        rest = self._command_queue.get(packet.sequence)
-        if rest is None:
-            raise ValueError(
-                f"Unexpected command response (sequence {packet.sequence})"
-            )
-        if packet.index in rest:
+        # Sequence and index are parsed out of the packet data on each
+        # access, so bind them once up front
+        sequence = packet.sequence
+        index = packet.index
+        queue = self._command_queue
+
+        command = queue[sequence]
+        if command is None:
+            raise ValueError(f"Unexpected command response (sequence {sequence})")
+
+        parts = command.parts
+        if parts is None:
+            command.parts = parts = [None] * packet.total
+            command.full_mask = (1 << packet.total) - 1
+        elif packet.total != (expected_total := len(parts)):
             raise ValueError(
-                f"Command response index {packet.index} already received "
-                f"(sequence {packet.sequence})"
+                f"Command response total {packet.total} for index {index} "
+                f"does not match the previously defined total of {expected_total} "
+                f"(sequence {sequence})"
             )
-        if rest and packet.total != (expected_total := next(iter(rest.values())).total):
+
+        bit = 1 << index
+        if command.received_mask & bit:
             raise ValueError(
-                f"Command response total {packet.total} for index {packet.index} "
-                f"does not match the previously defined total of {expected_total} "
-                f"(sequence {packet.sequence})"
+                f"Command response index {index} already received "
+                f"(sequence {sequence})"
             )
 
         # NOTE: despite the above checks, we have not asserted any specific
         #       order in which the packets should arrive
 
-        rest[packet.index] = packet
-        if len(rest) < packet.total:
+        parts[index] = packet.message
+        command.received_mask |= bit
+        if command.received_mask != command.full_mask:
             return (), ()
 
-        self.invalidate_command(packet.sequence)
+        # Inlined from invalidate_command(); the state was already
+        # asserted at the top of this method
+        queue[sequence] = None
 
         # This should be guaranteed to work
-        message_bytes = b"".join(rest[i].message for i in range(packet.total))
-        message_str = message_bytes.decode()
+        message_str = b"".join(parts).decode()  # type: ignore[arg-type]
 
-        return (ClientCommandEvent(packet.sequence, message_str),), ()
+        return (ClientCommandEvent(sequence, message_str),), ()
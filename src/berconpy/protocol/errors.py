@@ -16,9 +16,12 @@ class InvalidStateError(RCONError, Generic[T]):
     def __init__(self, current_state: T, expected_states: tuple[T, ...]):
         self.current_state = current_state
         self.expected_states = expected_states
-        super().__init__(
-            "protocol state must be one of {}, received {} instead".format(
-                ", ".join(str(s) for s in self.expected_states),
-                self.current_state,
-            )
+        super().__init__(current_state, expected_states)
+
+    def __str__(self) -> str:
+        # Formatted lazily since callers may catch this exception
+        # without ever rendering its message
+        return "protocol state must be one of {}, received {} instead".format(
+            ", ".join(str(s) for s in self.expected_states),
+            self.current_state,
         )
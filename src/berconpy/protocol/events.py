@@ -7,12 +7,16 @@ class Event:
     subclasses.
     """
 
+    __slots__ = ()
+
 
 class ClientEvent(Event):
     """An event produced by the :py:class:`RCONClientProtocol` subclass."""
 
+    __slots__ = ()
+
 
-@dataclass
+@dataclass(slots=True)
 class ClientAuthEvent(ClientEvent):
     """Indicates if an authentication request was successful."""
 
@@ -20,7 +24,7 @@ class ClientAuthEvent(ClientEvent):
     """``True`` if the client was authenticated, ``False`` otherwise."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientCommandEvent(ClientEvent):
     """Represents the response to a given command."""
 
@@ -30,7 +34,7 @@ class ClientCommandEvent(ClientEvent):
     """The command's full response from the server."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientMessageEvent(ClientEvent):
     """Represents a message sent by the server.
 
@@ -46,8 +50,10 @@ class ClientMessageEvent(ClientEvent):
 class ServerEvent(Event):
     """An event produced by the :py:class:`RCONServerProtocol` subclass."""
 
+    __slots__ = ()
+
 
-@dataclass
+@dataclass(slots=True)
 class ServerAuthEvent(ServerEvent):
     """Indicates if an authentication request was successful.
 
@@ -60,7 +66,7 @@ class ServerAuthEvent(ServerEvent):
     """``True`` if the server authenticated the client, ``False`` otherwise."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerCommandEvent(ServerEvent):
     """Represents a command sent by the client."""
 
@@ -74,7 +80,7 @@ class ServerCommandEvent(ServerEvent):
     """The command that was requested by the client."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerMessageEvent(ServerEvent):
     """Represents an acknowledgement of a message sent by the server."""
 
@@ -4,8 +4,8 @@ the client and server.
 """
 import binascii
 import enum
-import functools
-from typing import Literal, Type, overload
+import struct
+from typing import Literal, overload
 
 __all__ = (
     "PacketType",
@@ -21,26 +21,6 @@ __all__ = (
 )
 
 
-def _convert_exception(
-    from_exc: Type[Exception],
-    to_exc: Type[Exception],
-    message: str | None = None,
-):
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except from_exc as e:
-                if message is not None:
-                    raise to_exc(message) from e
-                raise to_exc from e
-
-        return wrapper
-
-    return decorator
-
-
 class PacketType(enum.Enum):
     """The type of packet received by the server.
 
@@ -73,6 +53,18 @@ class PacketType(enum.Enum):
     """
 
 
+_PREFIX_CRC = {t.value: binascii.crc32(bytes((0xFF, t.value))) for t in PacketType}
+"""Maps each type byte to the CRC32 of the constant ``0xFF``/type prefix."""
+
+_CHECKSUM = struct.Struct("<I")
+"""The checksum field's layout, for reading it without slicing."""
+
+_INITIAL_MESSAGES = {
+    t: b"BE\x00\x00\x00\x00\xff" + bytes((t.value,)) for t in PacketType
+}
+"""Maps each packet type to its eight-byte header with a zeroed checksum."""
+
+
 class Packet:
     """The base class used for all messages sent between
     the BattlEye RCON server and client.
@@ -110,7 +102,7 @@ class Packet:
     @property
     def checksum(self) -> int:
         """The CRC32 checksum included in the header."""
-        return int.from_bytes(self.data[2:6], "little")
+        return _CHECKSUM.unpack_from(self.data, 2)[0]
 
     @property
     def type(self) -> PacketType:
@@ -190,7 +182,6 @@ class Packet:
         ...
 
     @classmethod
-    @_convert_exception(IndexError, ValueError, "insufficient data provided")
     def from_bytes(cls, data: bytes, *, from_client: bool) -> "Packet":
         """Constructs a packet from the given data.
 
@@ -204,72 +195,36 @@ class Packet:
             packet specification.
 
         """
-        if data[:2] != b"BE":
+        if len(data) < 8:
+            raise ValueError("insufficient data provided")
+        elif data[:2] != b"BE":
             raise ValueError("expected BE as start of header")
         elif data[6] != 255:
             raise ValueError("expected 0xFF at end of header")
 
-        crc = int.from_bytes(data[2:6], "little")
+        crc = _CHECKSUM.unpack_from(data, 2)[0]
 
         try:
-            ptype = PacketType(data[7])
-        except ValueError:
+            parser = _PARSERS[data[7], from_client]
+        except KeyError:
             raise ValueError(f"unknown packet type: {data[7]}") from None
 
-        if ptype is PacketType.LOGIN and from_client:
-            if b"\x00" in data[8:]:
-                raise ValueError("login password cannot have a null byte")
-            return ClientLoginPacket(data[8:]).assert_checksum(crc)
-
-        elif ptype is PacketType.LOGIN and not from_client:
-            if data[8] not in (0, 1):
-                raise ValueError("authentication byte must be 0 or 1")
-            elif len(data[8:]) != 1:
-                raise ValueError("unexpected excess data after authentication byte")
-            return ServerLoginPacket(bool(data[8])).assert_checksum(crc)
-
-        elif ptype is PacketType.COMMAND and from_client:
-            sequence = data[8]
-            command = data[9:]
-            return ClientCommandPacket(sequence, command).assert_checksum(crc)
-
-        elif ptype is PacketType.COMMAND and not from_client:
-            sequence = data[8]
-            if len(data) > 9 and data[9] == 0:
-                total, index = data[10], data[11]
-                response = data[12:]
-            else:
-                total, index = 1, 0
-                response = data[9:]
-
-            if index >= total:
-                raise ValueError(
-                    f"index ({index}) cannot equal or exceed total ({total})"
-                )
-            packet = ServerCommandPacket(sequence, total, index, response)
-            return packet.assert_checksum(crc)
-
-        elif ptype is PacketType.MESSAGE and from_client:
-            sequence = data[8]
-            return ClientMessagePacket(sequence).assert_checksum(crc)
-
-        elif ptype is PacketType.MESSAGE and not from_client:
-            sequence = data[8]
-            message = data[9:]
-            return ServerMessagePacket(sequence, message).assert_checksum(crc)
-
-        raise RuntimeError(  # pragma: no cover
-            f"unhandled PacketType enum: {ptype} (from_client: {from_client})"
-        )
+        return parser(data).assert_checksum(crc)
 
     @staticmethod
-    def _encode_header(message: bytes):
-        crc = binascii.crc32(message).to_bytes(4, "little")
-        return b"BE" + crc
+    def _get_initial_message(packet_type: PacketType) -> bytearray:
+        return bytearray(_INITIAL_MESSAGES[packet_type])
 
     @staticmethod
-    def _get_initial_message(packet_type: PacketType) -> bytearray:
-        return bytearray((0xFF, packet_type.value))
+    def _finish_message(buffer: bytearray) -> bytes:
+        """Fills in the CRC32 checksum over the buffer's payload
+        and returns the finished message.
+        """
+        # The checksum covers the 0xFF/type prefix too, but those two
+        # bytes are constant per type so their CRC is used as the seed
+        crc = binascii.crc32(memoryview(buffer)[8:], _PREFIX_CRC[buffer[7]])
+        buffer[2:6] = crc.to_bytes(4, "little")
+        return bytes(buffer)
 
 
 class ClientPacket(Packet):
@@ -283,6 +238,13 @@ class ClientPacket(Packet):
 
     """
 
+    is_command = False
+    """Indicates if this is a :py:class:`ClientCommandPacket`.
+
+    This is cheaper to look up than an :py:func:`isinstance()` check.
+
+    """
+
 
 class ClientLoginPacket(ClientPacket):
     """The packet used to log in a client.
@@ -291,33 +253,17 @@ class ClientLoginPacket(ClientPacket):
 
     """
 
+    type = PacketType.LOGIN
+
     def __init__(self, password: bytes):
         buffer = self._get_initial_message(PacketType.LOGIN)
         buffer.extend(password)
 
-        payload = bytes(buffer)
-        header = self._encode_header(payload)
-        super().__init__(header + payload)
+        super().__init__(self._finish_message(buffer))
 
     def __repr__(self):
         return "{}({!r})".format(type(self).__name__, self.message)
 
-    @property
-    def login_success(self) -> None:
-        ...
-
-    @property
-    def sequence(self) -> None:
-        ...
-
-    @property
-    def total(self) -> None:
-        ...
-
-    @property
-    def index(self) -> None:
-        ...
-
     @property
     def message(self) -> bytes:
         return self.data[8:]
@@ -331,34 +277,24 @@ class ClientCommandPacket(ClientPacket):
 
     """
 
+    type = PacketType.COMMAND
+
+    is_command = True
+
     def __init__(self, sequence: int, command: bytes):
         buffer = self._get_initial_message(PacketType.COMMAND)
         buffer.append(sequence)
         buffer.extend(command)
 
-        payload = bytes(buffer)
-        header = self._encode_header(payload)
-        super().__init__(header + payload)
+        super().__init__(self._finish_message(buffer))
 
     def __repr__(self):
         return "{}({!r}, {!r})".format(type(self).__name__, self.sequence, self.message)
 
-    @property
-    def login_success(self) -> None:
-        ...
-
     @property
     def sequence(self) -> int:
         return self.data[8]
 
-    @property
-    def total(self) -> None:
-        ...
-
-    @property
-    def index(self) -> None:
-        ...
-
     @property
     def message(self) -> bytes:
         return self.data[9:]
@@ -371,36 +307,39 @@ class ClientMessagePacket(ClientPacket):
 
     """
 
+    type = PacketType.MESSAGE
+
     def __init__(self, sequence: int):
         buffer = self._get_initial_message(PacketType.MESSAGE)
         buffer.append(sequence)
 
-        payload = bytes(buffer)
-        header = self._encode_header(payload)
-        super().__init__(header + payload)
+        super().__init__(self._finish_message(buffer))
 
     def __repr__(self):
         return "{}({!r})".format(type(self).__name__, self.sequence)
 
-    @property
-    def login_success(self) -> None:
-        ...
-
     @property
     def sequence(self) -> int:
         return self.data[8]
 
-    @property
-    def total(self) -> None:
-        ...
 
-    @property
-    def index(self) -> None:
-        ...
+def _parse_client_login(data: bytes) -> "ClientLoginPacket":
+    # find() avoids slicing the password just to scan it
+    if data.find(b"\x00", 8) != -1:
+        raise ValueError("login password cannot have a null byte")
+    return ClientLoginPacket(data[8:])
 
-    @property
-    def message(self) -> None:
-        ...
+
+def _parse_client_command(data: bytes) -> "ClientCommandPacket":
+    if len(data) < 9:
+        raise ValueError("insufficient data provided")
+    return ClientCommandPacket(data[8], data[9:])
+
+
+def _parse_client_message(data: bytes) -> "ClientMessagePacket":
+    if len(data) < 9:
+        raise ValueError("insufficient data provided")
+    return ClientMessagePacket(data[8])
 
 
 class ServerPacket(Packet):
@@ -422,13 +361,13 @@ class ServerLoginPacket(ServerPacket):
 
     """
 
+    type = PacketType.LOGIN
+
     def __init__(self, success: bool):
         buffer = self._get_initial_message(PacketType.LOGIN)
         buffer.append(1 if success else 0)
 
-        payload = bytes(buffer)
-        header = self._encode_header(payload)
-        super().__init__(header + payload)
+        super().__init__(self._finish_message(buffer))
 
     def __repr__(self):
         return "{}({!r})".format(type(self).__name__, self.login_success)
@@ -437,22 +376,6 @@ class ServerLoginPacket(ServerPacket):
     def login_success(self) -> bool:
         return bool(self.data[8])
 
-    @property
-    def sequence(self) -> None:
-        ...
-
-    @property
-    def total(self) -> None:
-        ...
-
-    @property
-    def index(self) -> None:
-        ...
-
-    @property
-    def message(self) -> None:
-        ...
-
 
 class ServerCommandPacket(ServerPacket):
     """The packet(s) sent in response to a command.
@@ -468,7 +391,11 @@ class ServerCommandPacket(ServerPacket):
 
     """
 
-    def __init__(self, sequence: int, total: int, index: int, response: bytes):
+    type = PacketType.COMMAND
+
+    __slots__ = ("_index", "_message_start", "_total")
+
+    def __init__(self, sequence: int, total: int, index: int, response: "bytes | memoryview"):
         buffer = self._get_initial_message(PacketType.COMMAND)
         buffer.append(sequence)
         if total < 1:
@@ -479,40 +406,31 @@ class ServerCommandPacket(ServerPacket):
             buffer.extend((0, total, index))
         buffer.extend(response)
 
-        payload = bytes(buffer)
-        header = self._encode_header(payload)
-        super().__init__(header + payload)
+        self._total = total
+        self._index = index
+        self._message_start = 9 if total == 1 else 12
+        super().__init__(self._finish_message(buffer))
 
     def __repr__(self):
         return "{}({!r}, {!r}, {!r}, {!r})".format(
             type(self).__name__, self.sequence, self.total, self.index, self.message
         )
 
-    @property
-    def login_success(self) -> None:
-        ...
-
     @property
     def sequence(self) -> int:
         return self.data[8]
 
     @property
     def total(self) -> int:
-        if len(self.data) > 9 and self.data[9] == 0:
-            return self.data[10]
-        return 1
+        return self._total
 
     @property
     def index(self) -> int:
-        if len(self.data) > 9 and self.data[9] == 0:
-            return self.data[11]
-        return 0
+        return self._index
 
     @property
     def message(self) -> bytes:
-        if len(self.data) > 9 and self.data[9] == 0:
-            return self.data[12:]
-        return self.data[9:]
+        return self.data[self._message_start :]
 
 
 class ServerMessagePacket(ServerPacket):
@@ -523,34 +441,68 @@ class ServerMessagePacket(ServerPacket):
 
     """
 
+    type = PacketType.MESSAGE
+
     def __init__(self, sequence: int, message: bytes):
         buffer = self._get_initial_message(PacketType.MESSAGE)
         buffer.append(sequence)
         buffer.extend(message)
 
-        payload = bytes(buffer)
-        header = self._encode_header(payload)
-        super().__init__(header + payload)
+        super().__init__(self._finish_message(buffer))
 
     def __repr__(self):
         return "{}({!r}, {!r})".format(type(self).__name__, self.sequence, self.message)
 
-    @property
-    def login_success(self) -> None:
-        ...
-
     @property
     def sequence(self) -> int:
         return self.data[8]
 
-    @property
-    def total(self) -> None:
-        ...
-
-    @property
-    def index(self) -> None:
-        ...
-
     @property
     def message(self) -> bytes:
         return self.data[9:]
+
+
+def _parse_server_login(data: bytes) -> "ServerLoginPacket":
+    if len(data) < 9:
+        raise ValueError("insufficient data provided")
+    elif data[8] not in (0, 1):
+        raise ValueError("authentication byte must be 0 or 1")
+    elif len(data[8:]) != 1:
+        raise ValueError("unexpected excess data after authentication byte")
+    return ServerLoginPacket(bool(data[8]))
+
+
+def _parse_server_command(data: bytes) -> "ServerCommandPacket":
+    if len(data) < 9:
+        raise ValueError("insufficient data provided")
+
+    sequence = data[8]
+    if len(data) > 9 and data[9] == 0:
+        if len(data) < 12:
+            raise ValueError("insufficient data provided")
+        total, index = data[10], data[11]
+        response = data[12:]
+    else:
+        total, index = 1, 0
+        response = data[9:]
+
+    if index >= total:
+        raise ValueError(f"index ({index}) cannot equal or exceed total ({total})")
+    return ServerCommandPacket(sequence, total, index, response)
+
+
+def _parse_server_message(data: bytes) -> "ServerMessagePacket":
+    if len(data) < 9:
+        raise ValueError("insufficient data provided")
+    return ServerMessagePacket(data[8], data[9:])
+
+
+_PARSERS = {
+    (PacketType.LOGIN.value, True): _parse_client_login,
+    (PacketType.LOGIN.value, False): _parse_server_login,
+    (PacketType.COMMAND.value, True): _parse_client_command,
+    (PacketType.COMMAND.value, False): _parse_server_command,
+    (PacketType.MESSAGE.value, True): _parse_client_message,
+    (PacketType.MESSAGE.value, False): _parse_server_message,
+}
+"""Maps (type byte, from_client) pairs to their specialized parsers."""
@@ -1,6 +1,5 @@
 import enum
 import secrets
-from typing import Iterable
 
 from .base import RCONGenericProtocol
 from .check import Check, NonceCheck
@@ -38,13 +37,32 @@ class RCONServerProtocol(RCONGenericProtocol):
         or more packets to be returned by :py:meth:`respond_to_command()`.
     """
 
+    __slots__ = (
+        "command_check",
+        "password",
+        "response_chunk_size",
+        "state",
+        "_events",
+        "_message_queue",
+        "_next_sequence",
+        "_packet_handlers",
+        "_password_bytes",
+        "_to_send",
+        "__weakref__",
+    )
+
     state: ServerState
     """The current state of the protocol."""
 
     _events: list[ServerEvent]
     """A list of events waiting to be collected."""
-    _message_queue: set[int]
-    """A set of message sequences waiting to be acknowledged."""
+    _message_queue: int
+    """A bitmap of message sequences waiting to be acknowledged.
+
+    Sequences only span 0-255, so a 256-bit integer is cheaper
+    than a set of them.
+
+    """
     _next_sequence: int
     _to_send: list[ServerPacket]
 
@@ -61,6 +79,13 @@ class RCONServerProtocol(RCONGenericProtocol):
         self.command_check = command_check
         self.response_chunk_size = response_chunk_size
         self.password = password
+        # Encoded once so each login attempt only pays for the comparison
+        self._password_bytes = password.encode()
+        self._packet_handlers = {
+            ClientLoginPacket: self._handle_login_packet,
+            ClientCommandPacket: self._handle_command_packet,
+            ClientMessagePacket: self._handle_message_packet,
+        }
         self.reset()
 
     def __repr__(self) -> str:
@@ -80,10 +105,7 @@ class RCONServerProtocol(RCONGenericProtocol):
 
         """
         packet = Packet.from_bytes(data, from_client=True)
-        events, to_send = self._handle_packet(packet)
-        self._events.extend(events)
-        self._to_send.extend(to_send)
-
+        self._handle_packet(packet)
         return packet
 
     def events_received(self) -> list[ServerEvent]:
@@ -108,31 +130,33 @@ class RCONServerProtocol(RCONGenericProtocol):
 
         """
         self._events = []
-        self._message_queue = set()
+        self._message_queue = 0
         self._next_sequence = 0
         self.state = ServerState.AUTHENTICATING
         self._to_send = []
 
+        self.command_check.reset()
+
     def respond_to_command(
         self,
         sequence: int,
         response: str,
     ) -> list[ServerCommandPacket]:
         """Returns a list of payloads for responding to the client's command."""
-        response_bytes = response.encode()
-        byte_chunks = [
-            response_bytes[i : i + self.response_chunk_size]
-            for i in range(0, len(response_bytes), self.response_chunk_size)
-        ]
+        # Chunks are sliced as views so the response is only copied once,
+        # when each packet builds its buffer
+        mv = memoryview(response.encode())
+        chunk_size = self.response_chunk_size
+        total = (len(mv) + chunk_size - 1) // chunk_size
 
         return [
             ServerCommandPacket(
                 sequence=sequence,
-                total=len(byte_chunks),
+                total=total,
                 index=i,
-                response=part,
+                response=mv[i * chunk_size : (i + 1) * chunk_size],
             )
-            for i, part in enumerate(byte_chunks)
+            for i in range(total)
         ]
 
     def send_message(self, message: str) -> ServerMessagePacket:
@@ -149,7 +173,7 @@ class RCONServerProtocol(RCONGenericProtocol):
         """
         self._assert_state(ServerState.LOGGED_IN)
         sequence = self._get_next_sequence()
-        self._message_queue.add(sequence)
+        self._message_queue |= 1 << sequence
         return ServerMessagePacket(sequence, message.encode())
 
     def try_authenticate(self, password: bytes) -> ServerLoginPacket:
@@ -161,60 +185,64 @@ class RCONServerProtocol(RCONGenericProtocol):
 
         """
         self._assert_state(ServerState.AUTHENTICATING)
-        success = secrets.compare_digest(password, self.password.encode())
+        success = secrets.compare_digest(password, self._password_bytes)
         if success:
             self.state = ServerState.LOGGED_IN
-        else:
-            self.state = ServerState.AUTHENTICATING
 
         return ServerLoginPacket(success)
 
-    def _assert_state(self, *states: ServerState) -> None:
-        if self.state not in states:
-            raise InvalidStateError(self.state, states)
+    def _assert_state(self, state: ServerState) -> None:
+        if self.state is not state:
+            raise InvalidStateError(self.state, (state,))
 
     def _get_next_sequence(self) -> int:
         sequence = self._next_sequence
-        self._next_sequence = (sequence + 1) % 256
+        self._next_sequence = (sequence + 1) & 0xFF
         return sequence
 
-    def _handle_packet(
-        self,
-        packet: ClientPacket,
-    ) -> tuple[Iterable[ServerEvent], Iterable[ServerPacket]]:
+    def _handle_packet(self, packet: ClientPacket) -> None:
         """Handles the given :py:class:`ClientPacket`.
 
-        :returns: A tuple containing the events and payloads to send.
+        Any resulting events and payloads to send are appended to
+        :py:attr:`_events` and :py:attr:`_to_send` directly, avoiding
+        intermediate tuples on the per-datagram path.
+
         :raises ValueError: An error occurred while handling the given packet.
 
         """
-        if isinstance(packet, ClientLoginPacket):
-            # self._assert_state(ServerState.AUTHENTICATING)
-            # Client may authenticate multiple times
+        handler = self._packet_handlers.get(type(packet))
+        if handler is None:  # pragma: no cover
+            raise ValueError(f"unexpected packet received: {packet}")
 
-            payload = self.try_authenticate(packet.message)
-            return (ServerAuthEvent(payload.login_success),), (payload,)
+        handler(packet)
 
-        elif isinstance(packet, ClientCommandPacket):
-            self._assert_state(ServerState.LOGGED_IN)
+    def _handle_login_packet(self, packet: ClientLoginPacket) -> None:
+        """Specifically handles a :py:class:`ClientLoginPacket`."""
+        # self._assert_state(ServerState.AUTHENTICATING)
+        # Client may authenticate multiple times
 
-            if self.command_check(packet):
-                events = (ServerCommandEvent(packet.sequence, packet.message.decode()),)
-            else:
-                events = ()
+        payload = self.try_authenticate(packet.message)
+        self._events.append(ServerAuthEvent(payload.login_success))
+        self._to_send.append(payload)
 
-            return events, ()
+    def _handle_command_packet(self, packet: ClientCommandPacket) -> None:
+        """Specifically handles a :py:class:`ClientCommandPacket`."""
+        self._assert_state(ServerState.LOGGED_IN)
 
-        elif isinstance(packet, ClientMessagePacket):
-            self._assert_state(ServerState.LOGGED_IN)
+        if self.command_check(packet):
+            self._events.append(
+                ServerCommandEvent(packet.sequence, packet.message.decode())
+            )
 
-            try:
-                self._message_queue.remove(packet.sequence)
-            except KeyError:
-                raise ValueError(
-                    f"Unexpected message acknowledgement (sequence {packet.sequence})"
-                )
+    def _handle_message_packet(self, packet: ClientMessagePacket) -> None:
+        """Specifically handles a :py:class:`ClientMessagePacket`."""
+        self._assert_state(ServerState.LOGGED_IN)
 
-            return (ServerMessageEvent(packet.sequence),), ()
+        mask = 1 << packet.sequence
+        if not self._message_queue & mask:
+            raise ValueError(
+                f"Unexpected message acknowledgement (sequence {packet.sequence})"
+            )
+        self._message_queue &= ~mask
 
-        raise ValueError(f"unexpected packet received: {packet}")  # pragma: no cover
+        self._events.append(ServerMessageEvent(packet.sequence))
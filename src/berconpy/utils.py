@@ -1,4 +1,6 @@
 import inspect
+import operator
+import types
 from typing import Awaitable, Callable, Iterable, ParamSpec, TypeVar
 
 EMPTY = object()
@@ -25,13 +27,11 @@ def find(iterable: Iterable[T], predicate: Callable[[T], bool]) -> T | None:
 
 def get(iterable: Iterable[T], **attrs) -> T | None:
     """Returns the first item in the iterable that matches the given attributes."""
+    # attrgetter resolves the lookups at C level, once per attribute
+    getters = [(operator.attrgetter(attr), expected) for attr, expected in attrs.items()]
 
     def predicate(item: T):
-        for attr, expected in attrs.items():
-            value = getattr(item, attr)
-            if value != expected:
-                return False
-        return True
+        return all(g(item) == expected for g, expected in getters)
 
     return find(iterable, predicate)
 
@@ -42,6 +42,8 @@ async def maybe_coro(
     **kwargs: P.kwargs,
 ) -> T:
     ret = func(*args, **kwargs)
-    if inspect.isawaitable(ret):
+    # Plain coroutine functions are the overwhelmingly common async case;
+    # isawaitable() remains as the fallback for other awaitables
+    if type(ret) is types.CoroutineType or inspect.isawaitable(ret):
         return await ret
     return ret  # type: ignore
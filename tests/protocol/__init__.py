@@ -1,4 +1,5 @@
-from typing import Any, Sequence, Type, TypeVar, overload
+import itertools
+from typing import Any, Iterator, Sequence, Type, TypeVar, overload
 
 import pytest
 
@@ -13,6 +14,7 @@ from berconpy.protocol import (
     RCONServerProtocol,
     ServerAuthEvent,
     ServerEvent,
+    ServerLoginPacket,
     ServerPacket,
     ServerState,
 )
@@ -20,17 +22,29 @@ from berconpy.protocol import (
 expected_password = "foobar2000"
 incorrect_password = "abc123"
 
+# Serialized once; packets are immutable so tests can share these
+LOGIN_OK = ServerLoginPacket(success=True).data
+LOGIN_FAIL = ServerLoginPacket(success=False).data
+
 T = TypeVar("T")
 
 
+# Protocols are constructed once and reset between tests,
+# since reset() restores them to a freshly constructed state
+_shared_client = RCONClientProtocol()
+_shared_server = RCONServerProtocol(password=expected_password)
+
+
 @pytest.fixture
-def client() -> RCONClientProtocol:
-    return RCONClientProtocol()
+def client() -> Iterator[RCONClientProtocol]:
+    yield _shared_client
+    _shared_client.reset()
 
 
 @pytest.fixture
-def server() -> RCONServerProtocol:
-    return RCONServerProtocol(password=expected_password)
+def server() -> Iterator[RCONServerProtocol]:
+    yield _shared_server
+    _shared_server.reset()
 
 
 @overload
@@ -60,11 +74,9 @@ def communicate(
     :py:meth:`RCONGenericProtocol.packets_to_send()` from one protocol
     to the other and returns the events received by the second protocol.
     """
-    for packet in proto_a.packets_to_send():
-        proto_b.receive_datagram(packet.data)
-
-    for packet in packets:
-        proto_b.receive_datagram(packet.data)
+    receive = proto_b.receive_datagram
+    for packet in itertools.chain(proto_a.packets_to_send(), packets):
+        receive(packet.data)
 
     return proto_b.events_received()
 
@@ -13,90 +13,148 @@ from berconpy.protocol import (
     InvalidStateError,
     RCONClientProtocol,
     ServerCommandPacket,
-    ServerLoginPacket,
     ServerMessagePacket,
 )
 
-from . import client, first_and_only_event
+from . import LOGIN_FAIL, LOGIN_OK, client, first_and_only_event
 
+MESSAGE = ServerMessagePacket(sequence=0, message=b"Hello world!")
+COMMAND_RESPONSE = ServerCommandPacket(
+    sequence=0,
+    total=1,
+    index=0,
+    response=b"Hello world!",
+)
 
-def test_invalid_states(client: RCONClientProtocol):
-    """Asserts the client will raise :py:exc:`InvalidStateError` where appropriate."""
-    for _ in range(2):
-        message = ServerMessagePacket(sequence=0, message=b"Hello world!")
-        command_response = ServerCommandPacket(
-            sequence=0,
-            total=1,
-            index=0,
-            response=b"Hello world!",
-        )
-
-        # Test state before authentication
-        with pytest.raises(InvalidStateError):
-            client.receive_datagram(message.data)
-        assert not client.events_received()
 
-        with pytest.raises(InvalidStateError):
-            client.receive_datagram(command_response.data)
-        assert not client.events_received()
+# Parametrized so the second run exercises a freshly reset protocol
+@pytest.mark.parametrize("iteration", [0, 1])
+def test_invalid_states(client: RCONClientProtocol, iteration: int):
+    """Asserts the client will raise :py:exc:`InvalidStateError` where appropriate."""
+    # Test state before authentication
+    with pytest.raises(InvalidStateError):
+        client.receive_datagram(MESSAGE.data)
+    assert not client.events_received()
 
-        with pytest.raises(InvalidStateError):
-            client.send_command("too early")
+    with pytest.raises(InvalidStateError):
+        client.receive_datagram(COMMAND_RESPONSE.data)
+    assert not client.events_received()
 
-        with pytest.raises(InvalidStateError):
-            client.invalidate_command(0)
+    with pytest.raises(InvalidStateError):
+        client.send_command("too early")
 
-        packet = client.authenticate("password")
+    with pytest.raises(InvalidStateError):
+        client.invalidate_command(0)
 
-        client.receive_datagram(ServerLoginPacket(success=False).data)
-        assert not first_and_only_event(client, ClientAuthEvent).success
+    packet = client.authenticate("password")
 
-        client.receive_datagram(ServerLoginPacket(success=True).data)
-        assert first_and_only_event(client, ClientAuthEvent).success
+    client.receive_datagram(LOGIN_FAIL)
+    assert not first_and_only_event(client, ClientAuthEvent).success
 
-        # Test state after authentication
-        with pytest.raises(InvalidStateError):
-            client.authenticate("already authenticated")
+    client.receive_datagram(LOGIN_OK)
+    assert first_and_only_event(client, ClientAuthEvent).success
 
-        client.receive_datagram(message.data)
-        assert first_and_only_event(client, ClientMessageEvent)
+    # Test state after authentication
+    with pytest.raises(InvalidStateError):
+        client.authenticate("already authenticated")
 
-        packet = client.send_command("Hello world!")
-        assert packet.sequence == command_response.sequence
-        client.receive_datagram(command_response.data)
-        assert first_and_only_event(client, ClientCommandEvent)
+    client.receive_datagram(MESSAGE.data)
+    assert first_and_only_event(client, ClientMessageEvent)
 
-        # Nothing to invalidate, just making sure it works without error
-        client.invalidate_command(0)
+    packet = client.send_command("Hello world!")
+    assert packet.sequence == COMMAND_RESPONSE.sequence
+    client.receive_datagram(COMMAND_RESPONSE.data)
+    assert first_and_only_event(client, ClientCommandEvent)
 
-        client.reset()
+    # Nothing to invalidate, just making sure it works without error
+    client.invalidate_command(0)
 
 
-def test_command_validation(client: RCONClientProtocol):
-    client.receive_datagram(ServerLoginPacket(success=True).data)
+@pytest.fixture
+def pending_command(
+    client: RCONClientProtocol,
+) -> tuple[RCONClientProtocol, int]:
+    """An authenticated client that has received the second half
+    of a two-part command response, out of order.
+    """
+    client.receive_datagram(LOGIN_OK)
     client.events_received()
 
-    # Unknown command
-    packet = ServerCommandPacket(sequence=0, total=1, index=0, response=b"")
-    with pytest.raises(ValueError):
-        client.receive_datagram(packet.data)
-
     seq = client.send_command("").sequence
 
     # Allow out-of-order packets
     packet = ServerCommandPacket(sequence=seq, total=2, index=1, response=b"world!")
     client.receive_datagram(packet.data)
 
-    # Mismatched total
-    packet = ServerCommandPacket(sequence=seq, total=1, index=0, response=b"")
+    return client, seq
+
+
+def test_command_unknown_sequence(client: RCONClientProtocol):
+    client.receive_datagram(LOGIN_OK)
+    client.events_received()
+
+    packet = ServerCommandPacket(sequence=0, total=1, index=0, response=b"")
     with pytest.raises(ValueError):
         client.receive_datagram(packet.data)
 
-    # Repeat packet
-    packet = ServerCommandPacket(sequence=seq, total=2, index=1, response=b"")
+
+@pytest.mark.parametrize(
+    "total,index,response",
+    [
+        pytest.param(1, 0, b"", id="mismatched total"),
+        pytest.param(2, 1, b"", id="repeated index"),
+    ],
+)
+def test_command_validation(
+    pending_command: tuple[RCONClientProtocol, int],
+    total: int,
+    index: int,
+    response: bytes,
+):
+    client, seq = pending_command
+    packet = ServerCommandPacket(
+        sequence=seq,
+        total=total,
+        index=index,
+        response=response,
+    )
     with pytest.raises(ValueError):
         client.receive_datagram(packet.data)
 
+
+def test_command_out_of_order_completion(
+    pending_command: tuple[RCONClientProtocol, int],
+):
+    client, seq = pending_command
     packet = ServerCommandPacket(sequence=seq, total=2, index=0, response=b"Hello ")
     client.receive_datagram(packet.data)
     assert first_and_only_event(client, ClientCommandEvent).message == "Hello world!"
+
+
+def test_receive_datagrams(client: RCONClientProtocol):
+    client.receive_datagram(LOGIN_OK)
+    client.events_received()
+
+    messages = [ServerMessagePacket(sequence=i, message=b"hi") for i in range(3)]
+    packets = client.receive_datagrams([m.data for m in messages])
+
+    assert [p.sequence for p in packets] == [0, 1, 2]
+    assert len(client.events_received()) == 3
+    assert len(client.packets_to_send()) == 3
+
+
+def test_receive_datagrams_invalid(client: RCONClientProtocol):
+    client.receive_datagram(LOGIN_OK)
+    client.events_received()
+
+    batch = [
+        ServerMessagePacket(sequence=0, message=b"first").data,
+        b"not a packet",
+        ServerMessagePacket(sequence=1, message=b"second").data,
+    ]
+    with pytest.raises(ValueError):
+        client.receive_datagrams(batch)
+
+    # Datagrams before the invalid one were processed; the rest were not
+    assert len(client.events_received()) == 1
+    assert len(client.packets_to_send()) == 1
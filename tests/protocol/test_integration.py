@@ -9,9 +9,7 @@ from berconpy.protocol import (
 from . import (
     authenticate,
     client,
-    communicate,
     expected_password,
-    first_and_only_packet,
     incorrect_password,
     server,
 )
@@ -36,19 +34,32 @@ def test_nonce_check_integration(
     #
     # The sequence number only goes up to 256 before overflowing
     # so the nonce check must be able to forget older sequences.
-    for i in range(2**9):
-        payload = client.send_command(str(i))
-        assert isinstance(communicate(client, server, payload)[0], ServerCommandEvent)
-        assert len(communicate(client, server, payload)) == 0
+    # Each payload is delivered twice in a row so the repeat stays
+    # within the nonce check's window.
+    payloads = [client.send_command(str(i)) for i in range(2**9)]
+    for payload in payloads:
+        server.receive_datagram(payload.data)
+        server.receive_datagram(payload.data)
+
+    events = server.events_received()
+    assert len(events) == len(payloads)
+    for i in (0, 255, 256, 511):
+        assert isinstance(events[i], ServerCommandEvent)
 
     # Normal messages
     #
     # Here we also verify that the client acknowledges each message,
     # even when the nonce check is preventing repeated events.
-    for i in range(2**9):
-        payload = server.send_message(str(i))
-        assert isinstance(communicate(server, client, payload)[0], ClientMessageEvent)
-        assert first_and_only_packet(client, ClientMessagePacket)
+    payloads = [server.send_message(str(i)) for i in range(2**9)]
+    for payload in payloads:
+        client.receive_datagram(payload.data)
+        client.receive_datagram(payload.data)
 
-        assert len(communicate(server, client, payload)) == 0
-        assert first_and_only_packet(client, ClientMessagePacket)
+    events = client.events_received()
+    acks = client.packets_to_send()
+    assert len(events) == len(payloads)
+    assert len(acks) == 2 * len(payloads)
+    for i in (0, 255, 256, 511):
+        assert isinstance(events[i], ClientMessageEvent)
+        assert isinstance(acks[2 * i], ClientMessagePacket)
+        assert isinstance(acks[2 * i + 1], ClientMessagePacket)